@@ -20,15 +20,18 @@ If not, see <https://www.gnu.org/licenses/>.
 """
 
 
+import bisect
+import math
 import numpy as np
 import os
 import pyqtgraph as pg
-import re
+
+from contextlib import contextmanager
 
 from qudi.core.connector import Connector
 from qudi.core.configoption import ConfigOption
 from qudi.util.units import ScaledFloat
-from qudi.util.helpers import natural_sort
+from qudi.util.helpers import natural_sort, natural_sort_key
 from qudi.core.module import GuiBase
 
 from qudi.util.colordefs import QudiPalettePale as palette
@@ -36,6 +39,55 @@ from PySide2 import QtCore, QtGui, QtWidgets
 from qudi.util import uic
 from qudi.util.widgets.plotting.image_widget import MouseTrackingImageWidget
 
+_INV_SQRT2 = 1.0 / math.sqrt(2.0)
+
+# Upper time limits in s, divisors and units used to scale the ROI history time axis. Times at
+# or above the last limit are shown in days.
+_TIME_THR = np.array([300, 7200, 172800], dtype=float)
+_TIME_DIV = np.array([1, 60, 3600, 86400], dtype=float)
+_TIME_LBL = ('s', 'min', 'h', 'd')
+
+
+@contextmanager
+def _suspended_view_updates(view_widget):
+    """
+    Context manager suppressing repaints and auto-ranging of a pyqtgraph PlotWidget while several
+    items are changed. The view is repainted once on exit. Nested use is safe.
+    """
+    view_box = view_widget.getViewBox()
+    auto_range = view_box.autoRangeEnabled()
+    updates_enabled = view_widget.updatesEnabled()
+    view_box.disableAutoRange()
+    view_widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        view_box.enableAutoRange(x=auto_range[0], y=auto_range[1])
+        if updates_enabled:
+            view_widget.setUpdatesEnabled(True)
+            view_widget.update()
+
+
+# Name validation patterns (compiled once) for ROI/POI names and the optional POI nametag.
+# Unicode properties make \w match the same word characters as Python's re module.
+_NAME_QRE = QtCore.QRegularExpression(
+    r'\w+', QtCore.QRegularExpression.UseUnicodePropertiesOption)
+_NAME_QRE.optimize()
+_OPTIONAL_NAME_QRE = QtCore.QRegularExpression(
+    r'\w*', QtCore.QRegularExpression.UseUnicodePropertiesOption)
+_OPTIONAL_NAME_QRE.optimize()
+
+# Bound formatter for the active POI coordinates label. Expects three ScaledFloat values.
+_POI_COORDS_FMT = '({0:.2r}m, {1:.2r}m, {2:.2r}m)'.format
+
+
+class PoiMarkerRegistry(QtCore.QObject):
+    """
+    Single signal hub shared by all POI markers. Clicking on any marker emits sigPoiSelected with
+    the name of the clicked POI, so only one connection is needed regardless of the marker count.
+    """
+    sigPoiSelected = QtCore.Signal(str)
+
 
 class PoiMarker(pg.EllipseROI):
     """
@@ -50,30 +102,36 @@ class PoiMarker(pg.EllipseROI):
     default_pen = {'color': '#F0F', 'width': 2}
     select_pen = {'color': '#FFF', 'width': 2}
 
-    sigPoiSelected = QtCore.Signal(str)
+    # Pens, colors and label font shared by all markers
+    _default_qpen = pg.mkPen(**default_pen)
+    _select_qpen = pg.mkPen(**select_pen)
+    _default_qcolor = pg.mkColor(default_pen['color'])
+    _select_qcolor = pg.mkColor(select_pen['color'])
+    _label_font = None
 
-    def __init__(self, position, radius, poi_name=None, view_widget=None, **kwargs):
+    def __init__(self, position, radius, poi_name=None, view_widget=None, registry=None,
+                 **kwargs):
         """
 
         @param position:
         @param radius:
         @param poi_name:
         @param view_widget:
+        @param PoiMarkerRegistry registry: Signal hub to notify about clicks on this marker
         @param kwargs:
         """
         self._poi_name = '' if poi_name is None else poi_name
         self._view_widget = view_widget
+        self._registry = registry
         self._selected = False
-        self._position = np.array(position, dtype=float)
+        self._position = (float(position[0]), float(position[1]))
+        self._radius = float(radius)
+        self._label = None  # pg.TextItem created lazily when first added to a view widget
 
         size = (2 * radius, 2 * radius)
-        super().__init__(pos=self._position, size=size, pen=self.default_pen, **kwargs)
+        super().__init__(pos=self._position, size=size, pen=self._default_qpen, **kwargs)
         # self.aspectLocked = True
-        self.label = pg.TextItem(text=self._poi_name,
-                                 anchor=(0, 1),
-                                 color=self.default_pen['color'])
         self.setAcceptedMouseButtons(QtCore.Qt.LeftButton)
-        self.sigClicked.connect(self._notify_clicked_poi_name)
         self.set_position(self._position)
         return
 
@@ -82,7 +140,7 @@ class PoiMarker(pg.EllipseROI):
 
     @property
     def radius(self):
-        return self.size()[0] / 2
+        return self._radius
 
     @property
     def selected(self):
@@ -94,26 +152,75 @@ class PoiMarker(pg.EllipseROI):
 
     @property
     def position(self):
-        return self._position
+        return np.array(self._position)
 
-    @QtCore.Slot()
-    def _notify_clicked_poi_name(self):
-        self.sigPoiSelected.emit(self._poi_name)
+    @property
+    def label(self):
+        return self._label
+
+    def _create_label(self):
+        if PoiMarker._label_font is None:
+            PoiMarker._label_font = QtGui.QFont()
+        color = self._select_qcolor if self._selected else self._default_qcolor
+        self._label = pg.TextItem(text=self._poi_name, anchor=(0, 1), color=color)
+        self._label.setFont(self._label_font)
+        label_offset = self._radius * _INV_SQRT2
+        self._label.setPos(
+            QtCore.QPointF(self._position[0] + label_offset, self._position[1] + label_offset))
+        return
+
+    def mouseClickEvent(self, ev):
+        if ev.button() == QtCore.Qt.LeftButton and self._registry is not None:
+            ev.accept()
+            self._registry.sigPoiSelected.emit(self._poi_name)
+        else:
+            super().mouseClickEvent(ev)
 
     def add_to_view_widget(self, view_widget=None):
         if view_widget is not None:
             self._view_widget = view_widget
+        if self._label is None:
+            self._create_label()
         self._view_widget.addItem(self)
-        self._view_widget.addItem(self.label)
+        self._view_widget.addItem(self._label)
         return
 
     def delete_from_view_widget(self, view_widget=None):
         if view_widget is not None:
             self._view_widget = view_widget
-        self._view_widget.removeItem(self.label)
+        if self._label is not None:
+            self._view_widget.removeItem(self._label)
         self._view_widget.removeItem(self)
         return
 
+    @classmethod
+    def add_many(cls, view_widget, markers):
+        """
+        Add several markers to a view widget while suppressing intermediate repaints and
+        auto-ranging. The view is updated once after all markers have been added.
+
+        @param view_widget: pyqtgraph PlotWidget to add the markers to
+        @param PoiMarker[] markers: The markers to add
+        """
+        with _suspended_view_updates(view_widget):
+            for marker in markers:
+                marker.add_to_view_widget(view_widget)
+        return
+
+    @classmethod
+    def remove_many(cls, view_widget, markers):
+        """
+        Remove several markers from a view widget while suppressing intermediate repaints and
+        auto-ranging. The view is updated once after all markers have been removed.
+
+        @param view_widget: pyqtgraph PlotWidget to remove the markers from
+        @param PoiMarker[] markers: The markers to remove
+        """
+        with _suspended_view_updates(view_widget):
+            for marker in markers:
+                marker.delete_from_view_widget(view_widget)
+        return
+
     def set_position(self, position):
         """
         Sets the POI position and center the marker circle on that position.
@@ -121,11 +228,13 @@ class PoiMarker(pg.EllipseROI):
 
         @param float[2] position: The (x,y) center position of the POI marker
         """
-        self._position = np.array(position, dtype=float)
-        radius = self.radius
-        label_offset = radius / np.sqrt(2)
-        self.setPos(self._position[0] - radius, self._position[1] - radius)
-        self.label.setPos(self._position[0] + label_offset, self._position[1] + label_offset)
+        px, py = float(position[0]), float(position[1])
+        self._position = (px, py)
+        radius = self._radius
+        label_offset = radius * _INV_SQRT2
+        self.setPos(QtCore.QPointF(px - radius, py - radius))
+        if self._label is not None:
+            self._label.setPos(QtCore.QPointF(px + label_offset, py + label_offset))
         return
 
     def set_name(self, name):
@@ -135,7 +244,8 @@ class PoiMarker(pg.EllipseROI):
         @param str name:
         """
         self._poi_name = name
-        self.label.setText(self._poi_name)
+        if self._label is not None:
+            self._label.setText(self._poi_name)
         return
 
     def set_radius(self, radius):
@@ -144,10 +254,16 @@ class PoiMarker(pg.EllipseROI):
 
         @param float radius: The radius of the circle
         """
-        label_offset = radius / np.sqrt(2)
+        radius = float(radius)
+        if radius == self._radius:
+            return
+        self._radius = radius
+        px, py = self._position
+        label_offset = radius * _INV_SQRT2
         self.setSize((2 * radius, 2 * radius))
-        self.setPos(self.position[0] - radius, self.position[1] - radius)
-        self.label.setPos(self.position[0] + label_offset, self.position[1] + label_offset)
+        self.setPos(QtCore.QPointF(px - radius, py - radius))
+        if self._label is not None:
+            self._label.setPos(QtCore.QPointF(px + label_offset, py + label_offset))
         return
 
     def select(self):
@@ -156,8 +272,9 @@ class PoiMarker(pg.EllipseROI):
         PoiMarker.select_pen.
         """
         self._selected = True
-        self.setPen(self.select_pen)
-        self.label.setColor(self.select_pen['color'])
+        self.setPen(self._select_qpen)
+        if self._label is not None:
+            self._label.setColor(self._select_qcolor)
         return
 
     def deselect(self):
@@ -166,62 +283,12 @@ class PoiMarker(pg.EllipseROI):
         PoiMarker.default_pen.
         """
         self._selected = False
-        self.setPen(self.default_pen)
-        self.label.setColor(self.default_pen['color'])
+        self.setPen(self._default_qpen)
+        if self._label is not None:
+            self._label.setColor(self._default_qcolor)
         return
 
 
-class NameValidator(QtGui.QValidator):
-    """
-    This is a validator for strings that should be compatible with filenames and likes.
-    So no special characters (except '_') and blanks are allowed.
-    """
-
-    name_re = re.compile(r'([\w]+)')
-
-    def __init__(self, *args, empty_allowed=False, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._empty_allowed = bool(empty_allowed)
-
-    def validate(self, string, position):
-        """
-        This is the actual validator. It checks whether the current user input is a valid string
-        every time the user types a character. There are 3 states that are possible.
-        1) Invalid: The current input string is invalid. The user input will not accept the last
-                    typed character.
-        2) Acceptable: The user input in conform with the regular expression and will be accepted.
-        3) Intermediate: The user input is not a valid string yet but on the right track. Use this
-                         return value to allow the user to type fill-characters needed in order to
-                         complete an expression.
-        @param string: The current input string (from a QLineEdit for example)
-        @param position: The current position of the text cursor
-        @return: enum QValidator::State: the returned validator state,
-                 str: the input string, int: the cursor position
-        """
-        # Return intermediate status when empty string is passed
-        if not string:
-            if self._empty_allowed:
-                return self.Acceptable, '', position
-            else:
-                return self.Intermediate, string, position
-
-        match = self.name_re.match(string)
-        if not match:
-            return self.Invalid, '', position
-
-        matched = match.group()
-        if matched == string:
-            return self.Acceptable, string, position
-
-        return self.Invalid, matched, position
-
-    def fixup(self, text):
-        match = self.name_re.search(text)
-        if match:
-            return match.group()
-        return ''
-
-
 class PoiManagerMainWindow(QtWidgets.QMainWindow):
 
     def __init__(self):
@@ -271,17 +338,33 @@ class PoiManagerGui(GuiBase):
     sigPoiNameChanged = QtCore.Signal(str)
     sigPoiNameTagChanged = QtCore.Signal(str)
     sigRoiNameChanged = QtCore.Signal(str)
-    sigAddPoiByClick = QtCore.Signal(np.ndarray)
+    sigAddPoiByClick = QtCore.Signal(tuple)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self._mw = None             # QMainWindow handle
+        self._logic = None          # Cached reference to the connected PoiManagerLogic
         self.x_shift_plot = None    # pyqtgraph PlotDataItem for ROI history plot
         self.y_shift_plot = None    # pyqtgraph PlotDataItem for ROI history plot
         self.z_shift_plot = None    # pyqtgraph PlotDataItem for ROI history plot
 
+        self._history_timer = None  # QTimer coalescing ROI history plot updates
+        self._pending_history = None  # Most recent ROI history waiting to be plotted
+        self._pending_refocus_timer = None  # Most recent refocus timer state waiting to be shown
+
         self._markers = dict()      # dict to hold handles for the POI markers
+        self._marker_registry = None  # PoiMarkerRegistry relaying clicks on any POI marker
+        self._cached_optimise_xy_size = None  # optimise_xy_size the marker radius was derived from
+        self._cached_marker_radius = None     # POI marker radius for _cached_optimise_xy_size
+        self._last_poi_coords = None  # (name, x, y, z) currently shown in poi_coords_label
+        self._selected_poi_name = None  # Name of the currently highlighted POI marker
+        self._delete_all_pois_dialog = None  # Reused QMessageBox, created on first use
+        self._load_roi_dialog = None  # Reused QFileDialog, created on first use
+        self._sorted_poi_names = list()  # natural sorted POI names shown in active_poi_ComboBox
+        self._sorted_poi_keys = list()   # natural sort keys of self._sorted_poi_names
+        self._last_poi_names = frozenset()  # POI names passed to the last _update_pois call
+        self._last_poi_names_sorted = list()  # natural sorted self._last_poi_names
 
         self.__poi_selector_active = False  # Flag indicating if the poi selector is active
 
@@ -291,35 +374,50 @@ class PoiManagerGui(GuiBase):
 
         This method executes the init methods for each of the GUIs.
         """
-        self._markers = dict()
+        logic = self._poi_manager_logic()
+        self._logic = logic
+        self._marker_registry = PoiMarkerRegistry(parent=self)
+
+        # Timer to coalesce bursts of ROI history updates into a single redraw per frame
+        self._pending_history = None
+        self._history_timer = QtCore.QTimer(parent=self)
+        self._history_timer.setSingleShot(True)
+        self._history_timer.setInterval(33)
+        self._history_timer.timeout.connect(self._flush_history_plot)
 
         self._mw = PoiManagerMainWindow()
+        # Back the active POI ComboBox with a string list model that can be replaced in one go
+        self._mw.active_poi_ComboBox.setModel(
+            QtCore.QStringListModel(self._mw.active_poi_ComboBox))
         # Configuring the dock widgets.
         self.restore_default_view()
 
-        # Add validator to LineEdits
-        self._mw.roi_name_LineEdit.setValidator(NameValidator())
-        self._mw.poi_name_LineEdit.setValidator(NameValidator())
-        self._mw.poi_nametag_LineEdit.setValidator(NameValidator(empty_allowed=True))
+        # Add validator to LineEdits. Only word characters (alphanumeric and '_') are allowed.
+        self._mw.roi_name_LineEdit.setValidator(
+            QtGui.QRegularExpressionValidator(_NAME_QRE, self._mw))
+        self._mw.poi_name_LineEdit.setValidator(
+            QtGui.QRegularExpressionValidator(_NAME_QRE, self._mw))
+        self._mw.poi_nametag_LineEdit.setValidator(
+            QtGui.QRegularExpressionValidator(_OPTIONAL_NAME_QRE, self._mw))
 
         # Initialize plots
         self.__init_roi_scan_image()
         self.__init_roi_history_plot()
 
         # Initialize refocus timer
-        self.update_refocus_timer(self._poi_manager_logic().module_state() == 'locked',
-                                  self._poi_manager_logic().refocus_period,
-                                  self._poi_manager_logic().refocus_period)
+        self.update_refocus_timer(logic.module_state() == 'locked',
+                                  logic.refocus_period,
+                                  logic.refocus_period)
         # Initialize POIs
-        self._update_pois(self._poi_manager_logic().poi_positions)
+        self._update_pois(logic.poi_positions)
         # Initialize ROI name
-        self._update_roi_name(self._poi_manager_logic().roi_name)
+        self._update_roi_name(logic.roi_name)
         # Initialize POI nametag
-        self._update_poi_nametag(self._poi_manager_logic().poi_nametag)
+        self._update_poi_nametag(logic.poi_nametag)
         # Initialize Auto POI threshold
-        self._update_poi_threshold(self._poi_manager_logic().poi_threshold)
+        self._update_poi_threshold(logic.poi_threshold)
         # Initialize Auto POI diameter
-        self._update_poi_diameter(self._poi_manager_logic().poi_diameter)
+        self._update_poi_diameter(logic.poi_diameter)
 
         # Connect signals
         self.__connect_internal_signals()
@@ -337,7 +435,19 @@ class PoiManagerGui(GuiBase):
         self.__disconnect_control_signals_to_logic()
         self.__disconnect_update_signals_from_logic()
         self.__disconnect_internal_signals()
+        self._history_timer.timeout.disconnect()
+        self._history_timer.stop()
+        self._history_timer = None
+        self._pending_history = None
+        self._pending_refocus_timer = None
         self._mw.close()
+        self._delete_all_pois_dialog = None
+        self._load_roi_dialog = None
+        self._markers.clear()
+        self._selected_poi_name = None
+        self._last_poi_coords = None
+        self._marker_registry = None
+        self._logic = None
 
     @QtCore.Slot()
     def restore_default_view(self):
@@ -378,8 +488,8 @@ class PoiManagerGui(GuiBase):
 
     def __init_roi_scan_image(self):
         # Get scan image from logic and update initialize plot
-        self._update_scan_image(self._poi_manager_logic().roi_scan_image,
-                                self._poi_manager_logic().roi_scan_image_extent)
+        self._update_scan_image(self._logic.roi_scan_image,
+                                self._logic.roi_scan_image_extent)
         return
 
     def __init_roi_history_plot(self):
@@ -391,6 +501,9 @@ class PoiManagerGui(GuiBase):
                                             symbolPen=palette.c1,
                                             symbolBrush=palette.c1,
                                             symbolSize=5,
+                                            autoDownsample=True,
+                                            downsampleMethod='peak',
+                                            clipToView=True,
                                             name='x')
         self.y_shift_plot = pg.PlotDataItem(x=[0],
                                             y=[0],
@@ -399,6 +512,9 @@ class PoiManagerGui(GuiBase):
                                             symbolPen=palette.c2,
                                             symbolBrush=palette.c2,
                                             symbolSize=5,
+                                            autoDownsample=True,
+                                            downsampleMethod='peak',
+                                            clipToView=True,
                                             name='y')
         self.z_shift_plot = pg.PlotDataItem(x=[0],
                                             y=[0],
@@ -407,6 +523,9 @@ class PoiManagerGui(GuiBase):
                                             symbolPen=palette.c3,
                                             symbolBrush=palette.c3,
                                             symbolSize=5,
+                                            autoDownsample=True,
+                                            downsampleMethod='peak',
+                                            clipToView=True,
                                             name='z')
 
         self._mw.sample_shift_ViewWidget.addLegend()
@@ -420,77 +539,85 @@ class PoiManagerGui(GuiBase):
         self._mw.sample_shift_ViewWidget.setLabel('bottom', 'Time', units='s')
         self._mw.sample_shift_ViewWidget.setLabel('left', 'Sample shift', units='m')
 
-        self._update_roi_history(self._poi_manager_logic().roi_pos_history)
+        self._update_roi_history(self._logic.roi_pos_history)
         return
 
     def __connect_update_signals_from_logic(self):
-        self._poi_manager_logic().sigOptimizeTimerUpdated.connect(
-            self.update_refocus_timer, QtCore.Qt.QueuedConnection)
-        self._poi_manager_logic().sigPoiUpdated.connect(
+        self._logic.sigOptimizeTimerUpdated.connect(
+            self._refocus_timer_updated, QtCore.Qt.QueuedConnection)
+        self._logic.sigPoiUpdated.connect(
             self.update_poi, QtCore.Qt.QueuedConnection)
-        self._poi_manager_logic().sigActivePoiUpdated.connect(
+        self._logic.sigActivePoiUpdated.connect(
             self.update_active_poi, QtCore.Qt.QueuedConnection)
-        self._poi_manager_logic().sigRoiUpdated.connect(self.update_roi, QtCore.Qt.QueuedConnection)
-        self._poi_manager_logic().sigOptimizeStateUpdated.connect(
+        self._logic.sigRoiUpdated.connect(self.update_roi, QtCore.Qt.QueuedConnection)
+        self._logic.sigPoiPositionsUpdated.connect(
+            self.update_poi_positions, QtCore.Qt.QueuedConnection)
+        self._logic.sigOptimizeStateUpdated.connect(
             self.update_refocus_state, QtCore.Qt.QueuedConnection)
-        self._poi_manager_logic().sigThresholdUpdated.connect(
+        self._logic.sigThresholdUpdated.connect(
             self._update_poi_threshold, QtCore.Qt.QueuedConnection)
-        self._poi_manager_logic().sigDiameterUpdated.connect(
+        self._logic.sigDiameterUpdated.connect(
             self._update_poi_diameter, QtCore.Qt.QueuedConnection)
         return
 
     def __disconnect_update_signals_from_logic(self):
-        self._poi_manager_logic().sigOptimizeTimerUpdated.disconnect()
-        self._poi_manager_logic().sigPoiUpdated.disconnect()
-        self._poi_manager_logic().sigActivePoiUpdated.disconnect()
-        self._poi_manager_logic().sigRoiUpdated.disconnect()
-        self._poi_manager_logic().sigOptimizeStateUpdated.disconnect()
+        self._logic.sigOptimizeTimerUpdated.disconnect()
+        self._logic.sigPoiUpdated.disconnect()
+        self._logic.sigActivePoiUpdated.disconnect()
+        self._logic.sigRoiUpdated.disconnect()
+        self._logic.sigPoiPositionsUpdated.disconnect()
+        self._logic.sigOptimizeStateUpdated.disconnect()
         return
 
     def __connect_control_signals_to_logic(self):
+        logic = self._logic
+        scan_axes = self._data_scan_axes
+        # Lambdas are only used where the bool argument of clicked/triggered must be dropped
         self._mw.new_poi_Action.triggered.connect(
-            self._poi_manager_logic().add_poi, QtCore.Qt.QueuedConnection)
+            logic.add_poi, QtCore.Qt.QueuedConnection)
         self._mw.auto_pois_PushButton.clicked.connect(
-            self._poi_manager_logic().auto_catch_poi, QtCore.Qt.QueuedConnection)
+            logic.auto_catch_poi, QtCore.Qt.QueuedConnection)
         self._mw.del_all_pois_PushButton.clicked.connect(
             self.delete_all_pois_clicked, QtCore.Qt.QueuedConnection)
         self._mw.goto_poi_Action.triggered.connect(
-            lambda: self._poi_manager_logic().go_to_poi(), QtCore.Qt.QueuedConnection)
+            lambda: logic.go_to_poi(), QtCore.Qt.QueuedConnection)
         self._mw.new_roi_Action.triggered.connect(
-            self._poi_manager_logic().reset_roi, QtCore.Qt.QueuedConnection)
+            logic.reset_roi, QtCore.Qt.QueuedConnection)
         self._mw.refind_poi_Action.triggered.connect(
-            self._poi_manager_logic().optimise_poi_position, QtCore.Qt.QueuedConnection)
+            logic.optimise_poi_position, QtCore.Qt.QueuedConnection)
         self._mw.get_confocal_image_PushButton.clicked.connect(
-            lambda: self._poi_manager_logic().set_scan_image(True, self._data_scan_axes), QtCore.Qt.QueuedConnection)
+            lambda: logic.set_scan_image(True, scan_axes), QtCore.Qt.QueuedConnection)
         self._mw.set_poi_PushButton.clicked.connect(
-            self._poi_manager_logic().add_poi, QtCore.Qt.QueuedConnection)
+            logic.add_poi, QtCore.Qt.QueuedConnection)
         self._mw.delete_last_pos_Button.clicked.connect(
-            lambda: self._poi_manager_logic().delete_history_entry(-1), QtCore.Qt.QueuedConnection)
+            lambda: logic.delete_history_entry(-1), QtCore.Qt.QueuedConnection)
         self._mw.manual_update_poi_PushButton.clicked.connect(
-            self._poi_manager_logic().move_roi_from_poi_position, QtCore.Qt.QueuedConnection)
+            logic.move_roi_from_poi_position, QtCore.Qt.QueuedConnection)
         self._mw.move_poi_PushButton.clicked.connect(
-            self._poi_manager_logic().set_poi_anchor_from_position, QtCore.Qt.QueuedConnection)
+            logic.set_poi_anchor_from_position, QtCore.Qt.QueuedConnection)
         self._mw.delete_poi_PushButton.clicked.connect(
-            lambda: self._poi_manager_logic().delete_poi(None), QtCore.Qt.QueuedConnection)
-        self._mw.active_poi_ComboBox.activated[str].connect(
-            self._poi_manager_logic().set_active_poi, QtCore.Qt.QueuedConnection)
+            lambda: logic.delete_poi(None), QtCore.Qt.QueuedConnection)
+        self._mw.active_poi_ComboBox.textActivated.connect(
+            logic.set_active_poi, QtCore.Qt.QueuedConnection)
         self._mw.goto_poi_after_update_checkBox.stateChanged.connect(
-            self._poi_manager_logic().set_move_scanner_after_optimise, QtCore.Qt.QueuedConnection)
+            logic.set_move_scanner_after_optimise, QtCore.Qt.QueuedConnection)
         self._mw.track_poi_Action.triggered.connect(
-            self._poi_manager_logic().toggle_periodic_refocus, QtCore.Qt.QueuedConnection)
+            logic.toggle_periodic_refocus, QtCore.Qt.QueuedConnection)
         self.sigTrackPeriodChanged.connect(
-            self._poi_manager_logic().set_refocus_period, QtCore.Qt.QueuedConnection)
+            logic.set_refocus_period, QtCore.Qt.QueuedConnection)
         self.sigPoiThresholdChanged.connect(
-            self._poi_manager_logic().set_poi_threshold)
+            logic.set_poi_threshold, QtCore.Qt.QueuedConnection)
         self.sigPoiDiameterChanged.connect(
-            self._poi_manager_logic().set_poi_diameter)
+            logic.set_poi_diameter, QtCore.Qt.QueuedConnection)
         self.sigRoiNameChanged.connect(
-            self._poi_manager_logic().rename_roi, QtCore.Qt.QueuedConnection)
+            logic.rename_roi, QtCore.Qt.QueuedConnection)
         self.sigPoiNameChanged.connect(
-            self._poi_manager_logic().rename_poi, QtCore.Qt.QueuedConnection)
+            logic.rename_poi, QtCore.Qt.QueuedConnection)
         self.sigPoiNameTagChanged.connect(
-            self._poi_manager_logic().set_poi_nametag, QtCore.Qt.QueuedConnection)
-        self.sigAddPoiByClick.connect(self._poi_manager_logic().add_poi, QtCore.Qt.QueuedConnection)
+            logic.set_poi_nametag, QtCore.Qt.QueuedConnection)
+        self.sigAddPoiByClick.connect(logic.add_poi, QtCore.Qt.QueuedConnection)
+        self._marker_registry.sigPoiSelected.connect(
+            logic.set_active_poi, QtCore.Qt.QueuedConnection)
         return
 
     def __disconnect_control_signals_to_logic(self):
@@ -504,7 +631,7 @@ class PoiManagerGui(GuiBase):
         self._mw.manual_update_poi_PushButton.clicked.disconnect()
         self._mw.move_poi_PushButton.clicked.disconnect()
         self._mw.delete_poi_PushButton.clicked.disconnect()
-        self._mw.active_poi_ComboBox.activated[str].disconnect()
+        self._mw.active_poi_ComboBox.textActivated.disconnect()
         self._mw.goto_poi_after_update_checkBox.stateChanged.disconnect()
         self._mw.track_poi_Action.triggered.disconnect()
         self.sigTrackPeriodChanged.disconnect()
@@ -514,8 +641,7 @@ class PoiManagerGui(GuiBase):
         self.sigPoiNameChanged.disconnect()
         self.sigPoiNameTagChanged.disconnect()
         self.sigAddPoiByClick.disconnect()
-        for marker in self._markers.values():
-            marker.sigPoiSelected.disconnect()
+        self._marker_registry.sigPoiSelected.disconnect()
         return
 
     def __connect_internal_signals(self):
@@ -530,22 +656,25 @@ class PoiManagerGui(GuiBase):
         self._mw.blink_correction_view_Action.triggered.connect(self.toggle_blink_correction)
         self._mw.poi_selector_Action.toggled.connect(self.toggle_poi_selector)
         self._mw.restore_default_view_Action.triggered.connect(self.restore_default_view)
+        # View toggles only affect widgets living in the GUI thread. Call them directly.
+        # Use triggered (user action only), since the .ui file already syncs the actions'
+        # checked state from visibilityChanged, which also fires when a tabified dock is hidden.
         self._mw.roi_map_view_Action.triggered.connect(
-            lambda: self.toggle_roi_map(self._mw.roi_map_view_Action.isChecked()))
+            self.toggle_roi_map, QtCore.Qt.DirectConnection)
         self._mw.poi_editor_view_Action.triggered.connect(
-            lambda: self._mw.poi_editor_dockWidget.setVisible(self._mw.poi_editor_view_Action.isChecked()))
+            self._mw.poi_editor_dockWidget.setVisible, QtCore.Qt.DirectConnection)
         self._mw.poi_tracker_view_Action.triggered.connect(
-            lambda: self._mw.poi_tracker_dockWidget.setVisible(self._mw.poi_tracker_view_Action.isChecked()))
+            self._mw.poi_tracker_dockWidget.setVisible, QtCore.Qt.DirectConnection)
         self._mw.auto_pois_view_Action.triggered.connect(
-            lambda: self._mw.auto_pois_dockWidget.setVisible(self._mw.auto_pois_view_Action.isChecked()))
+            self._mw.auto_pois_dockWidget.setVisible, QtCore.Qt.DirectConnection)
         self._mw.auto_pois_view_Action.triggered.connect(
-            lambda: self._mw.auto_find_POIs_Action.setVisible(self._mw.auto_pois_view_Action.isChecked()))
+            self._mw.auto_find_POIs_Action.setVisible, QtCore.Qt.DirectConnection)
         self._mw.sample_shift_view_Action.triggered.connect(
-            lambda: self._mw.sample_shift_dockWidget.setVisible(self._mw.sample_shift_view_Action.isChecked()))
+            self._mw.sample_shift_dockWidget.setVisible, QtCore.Qt.DirectConnection)
         self._mw.roi_management_view_Action.triggered.connect(
-            lambda: self._mw.roi_management_ToolBar.setVisible(self._mw.roi_management_view_Action.isChecked()))
+            self._mw.roi_management_ToolBar.setVisible, QtCore.Qt.DirectConnection)
         self._mw.poi_tools_view_Action.triggered.connect(
-            lambda: self._mw.poi_ToolBar.setVisible(self._mw.poi_tools_view_Action.isChecked()))
+            self._mw.poi_ToolBar.setVisible, QtCore.Qt.DirectConnection)
         return
 
     def __disconnect_internal_signals(self):
@@ -583,9 +712,8 @@ class PoiManagerGui(GuiBase):
     @QtCore.Slot(bool)
     def toggle_poi_selector(self, is_active):
         if is_active != self._mw.poi_selector_Action.isChecked():
-            self._mw.poi_selector_Action.blockSignals(True)
-            self._mw.poi_selector_Action.setChecked(is_active)
-            self._mw.poi_selector_Action.blockSignals(False)
+            with QtCore.QSignalBlocker(self._mw.poi_selector_Action):
+                self._mw.poi_selector_Action.setChecked(is_active)
         if is_active != self.__poi_selector_active:
             if is_active:
                 self._mw.roi_image.sigMouseClicked.connect(self.create_poi_from_click)
@@ -614,9 +742,8 @@ class PoiManagerGui(GuiBase):
         if button.button() != QtCore.Qt.MouseButton.LeftButton:
             return
         # Z position from ROI origin, X and Y positions from click event
-        new_pos = self._poi_manager_logic().roi_origin
-        new_pos[0], new_pos[1] = (pos[0], pos[1])
-        self.sigAddPoiByClick.emit(new_pos)
+        origin = self._logic.roi_origin
+        self.sigAddPoiByClick.emit((float(pos[0]), float(pos[1]), float(origin[2])))
         return
 
     @QtCore.Slot(dict)
@@ -638,22 +765,60 @@ class PoiManagerGui(GuiBase):
             self._update_pois(poi_dict=roi_dict['pois'])
         return
 
-    @QtCore.Slot(bool, float, float)
-    def update_refocus_timer(self, is_active, period, time_until_refocus):
-        if not self._mw.track_period_SpinBox.hasFocus():
-            self._mw.track_period_SpinBox.blockSignals(True)
-            self._mw.track_period_SpinBox.setValue(period)
-            self._mw.track_period_SpinBox.blockSignals(False)
+    @QtCore.Slot(dict)
+    def update_poi_positions(self, poi_dict):
+        """
+        Move the POI markers after a ROI shift. The set of POI names is unchanged in this case, so
+        the ComboBox and marker sizes are left alone.
 
-        self._mw.track_poi_Action.blockSignals(True)
-        self._mw.time_till_next_update_ProgressBar.blockSignals(True)
+        @param dict poi_dict: POI positions (float[3]) with POI names as keys
+        """
+        if poi_dict.keys() != self._markers.keys():
+            # Markers are out of sync with the logic. Fall back to a full update.
+            self._update_pois(poi_dict=poi_dict)
+            return
+        if self._markers:
+            xy_positions = np.array([poi_dict[name] for name in self._markers],
+                                    dtype=float)[:, :2].tolist()
+            with _suspended_view_updates(self._mw.roi_image.plot_widget):
+                for marker, xy_pos in zip(self._markers.values(), xy_positions):
+                    marker.set_position(xy_pos)
+        active_poi = self._logic.active_poi
+        if active_poi in poi_dict:
+            self._update_poi_coords_label(active_poi, poi_dict[active_poi])
+        return
+
+    @QtCore.Slot(bool, float, float)
+    def _refocus_timer_updated(self, is_active, period, time_until_refocus):
+        """
+        Remember the latest refocus timer state and schedule a single GUI update for the next
+        event loop iteration. Bursts of timer updates are thereby collapsed into one redraw.
+        """
+        schedule = self._pending_refocus_timer is None
+        self._pending_refocus_timer = (is_active, period, time_until_refocus)
+        if schedule:
+            QtCore.QTimer.singleShot(0, self._apply_refocus_timer)
+        return
 
-        self._mw.track_poi_Action.setChecked(is_active)
-        self._mw.time_till_next_update_ProgressBar.setMaximum(period)
-        self._mw.time_till_next_update_ProgressBar.setValue(time_until_refocus)
+    @QtCore.Slot()
+    def _apply_refocus_timer(self):
+        pending = self._pending_refocus_timer
+        self._pending_refocus_timer = None
+        if pending is not None and self._mw is not None:
+            self.update_refocus_timer(*pending)
+        return
 
-        self._mw.time_till_next_update_ProgressBar.blockSignals(False)
-        self._mw.track_poi_Action.blockSignals(False)
+    @QtCore.Slot(bool, float, float)
+    def update_refocus_timer(self, is_active, period, time_until_refocus):
+        if not self._mw.track_period_SpinBox.hasFocus():
+            with QtCore.QSignalBlocker(self._mw.track_period_SpinBox):
+                self._mw.track_period_SpinBox.setValue(period)
+
+        with QtCore.QSignalBlocker(self._mw.track_poi_Action), \
+                QtCore.QSignalBlocker(self._mw.time_till_next_update_ProgressBar):
+            self._mw.track_poi_Action.setChecked(is_active)
+            self._mw.time_till_next_update_ProgressBar.setMaximum(period)
+            self._mw.time_till_next_update_ProgressBar.setValue(time_until_refocus)
         return
 
     @QtCore.Slot(bool)
@@ -665,18 +830,23 @@ class PoiManagerGui(GuiBase):
     def update_poi(self, old_name, new_name, position):
         # Handle changed names and deleted/added POIs
         if old_name != new_name:
-            self._mw.active_poi_ComboBox.blockSignals(True)
-            # Remember current text
-            text_active_poi = self._mw.active_poi_ComboBox.currentText()
-            # sort POI names and repopulate ComboBoxes
-            self._mw.active_poi_ComboBox.clear()
-            poi_names = natural_sort(self._poi_manager_logic().poi_names)
-            self._mw.active_poi_ComboBox.addItems(poi_names)
-            if text_active_poi == old_name:
-                self._mw.active_poi_ComboBox.setCurrentText(new_name)
-            else:
-                self._mw.active_poi_ComboBox.setCurrentText(text_active_poi)
-            self._mw.active_poi_ComboBox.blockSignals(False)
+            with QtCore.QSignalBlocker(self._mw.active_poi_ComboBox):
+                # Remember current text
+                text_active_poi = self._mw.active_poi_ComboBox.currentText()
+                # Insert/remove only the changed POI names. Repopulate the ComboBox from scratch
+                # if it is out of sync with the cached sorted names.
+                if self._mw.active_poi_ComboBox.count() == len(self._sorted_poi_names):
+                    if old_name:
+                        self._remove_combobox_poi_name(old_name)
+                    if new_name:
+                        self._insert_combobox_poi_name(new_name)
+                else:
+                    self._set_combobox_poi_names(
+                        natural_sort(self._logic.poi_names))
+                if text_active_poi == old_name:
+                    self._mw.active_poi_ComboBox.setCurrentText(new_name)
+                else:
+                    self._mw.active_poi_ComboBox.setCurrentText(text_active_poi)
 
         # Delete/add/update POI marker to image
         if not old_name:
@@ -687,46 +857,41 @@ class PoiManagerGui(GuiBase):
             self._remove_poi_marker(name=old_name)
         else:
             # POI has been renamed and/or changed position
-            size = self._poi_manager_logic().optimise_xy_size * np.sqrt(2)
-            self._markers[old_name].set_name(new_name)
-            self._markers[new_name] = self._markers.pop(old_name)
-            self._markers[new_name].setSize((size, size))
-            self._markers[new_name].set_position(position[:2])
+            marker = self._markers.pop(old_name)
+            if self._selected_poi_name == old_name:
+                self._selected_poi_name = new_name
+            marker.set_name(new_name)
+            marker.set_radius(self._marker_radius())
+            marker.set_position(position[:2])
+            self._markers[new_name] = marker
 
         active_poi = self._mw.active_poi_ComboBox.currentText()
         if active_poi:
-            self._markers[active_poi].select()
+            self._select_poi_marker(active_poi)
         return
 
     @QtCore.Slot(str)
     def update_active_poi(self, name):
 
         # Deselect current marker
-        for marker in self._markers.values():
-            if marker.selected:
-                marker.deselect()
-                break
+        self._select_poi_marker(None)
 
         # Unselect POI if name is None or empty str
-        self._mw.active_poi_ComboBox.blockSignals(True)
-        if not name:
-            self._mw.active_poi_ComboBox.setCurrentIndex(-1)
-        else:
-            self._mw.active_poi_ComboBox.setCurrentText(name)
-        self._mw.active_poi_ComboBox.blockSignals(False)
+        with QtCore.QSignalBlocker(self._mw.active_poi_ComboBox):
+            if not name:
+                self._mw.active_poi_ComboBox.setCurrentIndex(-1)
+            else:
+                self._mw.active_poi_ComboBox.setCurrentText(name)
 
         if name:
-            active_poi_pos = self._poi_manager_logic().get_poi_position(name)
+            active_poi_pos = self._logic.get_poi_position(name)
         else:
             active_poi_pos = np.zeros(3)
-        self._mw.poi_coords_label.setText(
-            '({0:.2r}m, {1:.2r}m, {2:.2r}m)'.format(ScaledFloat(active_poi_pos[0]),
-                                                    ScaledFloat(active_poi_pos[1]),
-                                                    ScaledFloat(active_poi_pos[2])))
+        self._update_poi_coords_label(name, active_poi_pos)
 
         if name in self._markers:
-            self._markers[name].set_radius(self._poi_manager_logic().optimise_xy_size / np.sqrt(2))
-            self._markers[name].select()
+            self._markers[name].set_radius(self._marker_radius())
+            self._select_poi_marker(name)
         return
 
     @QtCore.Slot()
@@ -747,7 +912,9 @@ class PoiManagerGui(GuiBase):
     @QtCore.Slot()
     def roi_name_changed(self):
         """ Set the name of the current ROI."""
-        self.sigRoiNameChanged.emit(self._mw.roi_name_LineEdit.text())
+        name = self._mw.roi_name_LineEdit.text()
+        if name:
+            self.sigRoiNameChanged.emit(name)
         return
 
     @QtCore.Slot()
@@ -760,9 +927,8 @@ class PoiManagerGui(GuiBase):
         self.sigPoiNameChanged.emit(new_name)
 
         # After POI name is changed, empty name field
-        self._mw.poi_name_LineEdit.blockSignals(True)
-        self._mw.poi_name_LineEdit.setText('')
-        self._mw.poi_name_LineEdit.blockSignals(False)
+        with QtCore.QSignalBlocker(self._mw.poi_name_LineEdit):
+            self._mw.poi_name_LineEdit.setText('')
         return
 
     @QtCore.Slot()
@@ -774,29 +940,38 @@ class PoiManagerGui(GuiBase):
     def save_roi(self):
         """ Save ROI to file."""
         roi_name = self._mw.roi_name_LineEdit.text()
-        self._poi_manager_logic().rename_roi(roi_name)
-        self._poi_manager_logic().save_roi()
+        self._logic.rename_roi(roi_name)
+        self._logic.save_roi()
         return
 
     @QtCore.Slot()
     def load_roi(self):
         """ Load a saved ROI from file."""
-        this_file = QtWidgets.QFileDialog.getOpenFileName(self._mw,
-                                                          'Open ROI',
-                                                          self._poi_manager_logic().module_default_data_dir,
-                                                          'Data files (*.dat)')[0]
-        if this_file:
-            self._poi_manager_logic().load_roi(complete_path=this_file)
+        if self._load_roi_dialog is None:
+            self._load_roi_dialog = QtWidgets.QFileDialog(self._mw, 'Open ROI')
+            self._load_roi_dialog.setFileMode(QtWidgets.QFileDialog.ExistingFile)
+            self._load_roi_dialog.setAcceptMode(QtWidgets.QFileDialog.AcceptOpen)
+            self._load_roi_dialog.setNameFilter('Data files (*.dat)')
+            self._load_roi_dialog.setDirectory(self._logic.module_default_data_dir)
+        if self._load_roi_dialog.exec_() != QtWidgets.QDialog.Accepted:
+            return
+        selected_files = self._load_roi_dialog.selectedFiles()
+        if selected_files and selected_files[0]:
+            self._logic.load_roi(complete_path=selected_files[0])
         return
 
     @QtCore.Slot()
     def delete_all_pois_clicked(self):
-        result = QtWidgets.QMessageBox.question(self._mw, 'Qudi: Delete all POIs?',
-                                                'Are you sure to delete all POIs?',
-                                                QtWidgets.QMessageBox.Yes,
-                                                QtWidgets.QMessageBox.No)
-        if result == QtWidgets.QMessageBox.Yes:
-            self._poi_manager_logic().delete_all_pois()
+        if self._delete_all_pois_dialog is None:
+            self._delete_all_pois_dialog = QtWidgets.QMessageBox(
+                QtWidgets.QMessageBox.Question,
+                'Qudi: Delete all POIs?',
+                'Are you sure to delete all POIs?',
+                QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
+                self._mw
+            )
+        if self._delete_all_pois_dialog.exec_() == QtWidgets.QMessageBox.Yes:
+            self._logic.delete_all_pois()
         return
 
     def _update_scan_image(self, scan_image, image_extent):
@@ -810,17 +985,15 @@ class PoiManagerGui(GuiBase):
         return
 
     def _update_roi_name(self, name):
-        self._mw.roi_name_LineEdit.blockSignals(True)
-        self._mw.roi_name_LineEdit.setText(name)
-        self._mw.roi_name_LineEdit.blockSignals(False)
+        with QtCore.QSignalBlocker(self._mw.roi_name_LineEdit):
+            self._mw.roi_name_LineEdit.setText(name)
         return
 
     def _update_poi_nametag(self, tag):
         if tag is None:
             tag = ''
-        self._mw.poi_nametag_LineEdit.blockSignals(True)
-        self._mw.poi_nametag_LineEdit.setText(tag)
-        self._mw.poi_nametag_LineEdit.blockSignals(False)
+        with QtCore.QSignalBlocker(self._mw.poi_nametag_LineEdit):
+            self._mw.poi_nametag_LineEdit.setText(tag)
         return
 
     def _update_poi_threshold(self, threshold):
@@ -831,100 +1004,210 @@ class PoiManagerGui(GuiBase):
         self._mw.poi_diameter_doubleSpinBox.setValue(diameter)
         return
 
+    def _update_poi_coords_label(self, name, position):
+        """ Show the active POI position. Skipped if name and position did not change. """
+        key = (name, float(position[0]), float(position[1]), float(position[2]))
+        if key == self._last_poi_coords:
+            return
+        self._last_poi_coords = key
+        self._mw.poi_coords_label.setText(_POI_COORDS_FMT(*map(ScaledFloat, key[1:])))
+        return
+
     def _update_roi_history(self, history=None):
+        """
+        Schedule a redraw of the ROI history plot. Multiple updates arriving within one timer
+        interval are collapsed and only the most recent history is plotted.
+        """
         if history is None:
-            history = self._poi_manager_logic().roi_pos_history
+            history = self._logic.roi_pos_history
+        self._pending_history = history
+        if not self._history_timer.isActive():
+            self._history_timer.start()
+        return
 
-        if history.shape[1] != 4:
-            self.log.error('ROI history must be an array of type float[][4].')
+    @QtCore.Slot()
+    def _flush_history_plot(self):
+        history = self._pending_history
+        self._pending_history = None
+        if history is None:
             return
 
-        max_time = np.max(history[:, 0])
-        if max_time < 300:
-            self._mw.sample_shift_ViewWidget.setLabel('bottom', 'Time', units='s')
-            time_arr = history[:, 0]
-        elif max_time < 7200:
-            self._mw.sample_shift_ViewWidget.setLabel('bottom', 'Time', units='min')
-            time_arr = history[:, 0] / 60
-        elif max_time < 172800:
-            self._mw.sample_shift_ViewWidget.setLabel('bottom', 'Time', units='h')
-            time_arr = history[:, 0] / 3600
-        else:
-            self._mw.sample_shift_ViewWidget.setLabel('bottom', 'Time', units='d')
-            time_arr = history[:, 0] / 86400
+        if history.ndim != 2 or history.shape[1] != 4:
+            self.log.error('ROI history must be an array of type float[][4].')
+            return
 
-        self.x_shift_plot.setData(time_arr, history[:, 1])
-        self.y_shift_plot.setData(time_arr, history[:, 2])
-        self.z_shift_plot.setData(time_arr, history[:, 3])
+        # History entries are appended in chronological order, so the last time is the largest
+        max_time = history[-1, 0] if len(history) > 0 else 0
+        unit_index = int(np.searchsorted(_TIME_THR, max_time, side='right'))
+        divisor = _TIME_DIV[unit_index]
+        self._mw.sample_shift_ViewWidget.setLabel('bottom', 'Time', units=_TIME_LBL[unit_index])
+        time_arr = history[:, 0] / divisor
+
+        # history is a float[][4] ndarray. Hand column views to pyqtgraph without copying.
+        # Clipping and peak downsampling to the visible range is left to the plot items.
+        for column, plot in enumerate((self.x_shift_plot, self.y_shift_plot, self.z_shift_plot),
+                                      start=1):
+            plot.setData(time_arr, history[:, column])
         return
 
     def _update_pois(self, poi_dict):
         """ Populate the dropdown box for selecting a poi. """
-        self._mw.active_poi_ComboBox.blockSignals(True)
-
-        self._mw.active_poi_ComboBox.clear()
-
-        poi_names = natural_sort(poi_dict)
-        self._mw.active_poi_ComboBox.addItems(poi_names)
+        # Only re-sort POI names if the set of names changed since the last call
+        new_poi_names = frozenset(poi_dict)
+        if new_poi_names != self._last_poi_names:
+            self._last_poi_names = new_poi_names
+            self._last_poi_names_sorted = natural_sort(new_poi_names)
+        poi_names = self._last_poi_names_sorted
+
+        # Only insert/remove the changed names if the ComboBox is in sync with the cached names
+        # and the change is small. Otherwise repopulate it in one go.
+        old_combobox_names = set(self._sorted_poi_names)
+        combobox_names_to_delete = old_combobox_names.difference(new_poi_names)
+        combobox_names_to_add = new_poi_names.difference(old_combobox_names)
+        in_sync = self._mw.active_poi_ComboBox.count() == len(self._sorted_poi_names)
+        n_changes = len(combobox_names_to_delete) + len(combobox_names_to_add)
+        with QtCore.QSignalBlocker(self._mw.active_poi_ComboBox):
+            if in_sync and 2 * n_changes <= len(poi_names):
+                for name in combobox_names_to_delete:
+                    self._remove_combobox_poi_name(name)
+                for name in combobox_names_to_add:
+                    self._insert_combobox_poi_name(name)
+            else:
+                self._set_combobox_poi_names(poi_names)
 
         # Get two list of POI names. One of those to delete and one of those to add
         old_poi_names = set(self._markers)
-        new_poi_names = set(poi_names)
         names_to_delete = list(old_poi_names.difference(new_poi_names))
         names_to_add = list(new_poi_names.difference(old_poi_names))
 
-        # Delete markers accordingly
-        for name in names_to_delete:
-            self._remove_poi_marker(name)
-        # Update positions of all remaining markers
-        size = self._poi_manager_logic().optimise_xy_size * np.sqrt(2)
-        for name, marker in self._markers.items():
-            marker.setSize((size, size))
-            marker.set_position(poi_dict[name])
-        # Add new markers
-        for name in names_to_add:
-            self._add_poi_marker(name=name, position=poi_dict[name])
+        view_widget = self._mw.roi_image.plot_widget
+        radius = self._marker_radius()
+        # Repaint the ROI image only once after all markers have been removed, moved and added
+        with _suspended_view_updates(view_widget):
+            # Delete markers accordingly
+            removed_markers = list()
+            for name in names_to_delete:
+                removed_markers.append(self._markers.pop(name))
+                if name == self._selected_poi_name:
+                    self._selected_poi_name = None
+            PoiMarker.remove_many(view_widget, removed_markers)
+            # Update positions of all remaining markers
+            if self._markers:
+                # Gather all (x, y) positions in one array and hand plain floats to the markers
+                xy_positions = np.array([poi_dict[name] for name in self._markers],
+                                        dtype=float)[:, :2].tolist()
+                for marker, xy_pos in zip(self._markers.values(), xy_positions):
+                    marker.set_radius(radius)
+                    marker.set_position(xy_pos)
+            # Add new markers
+            added_markers = [
+                self._create_poi_marker(name=name, position=poi_dict[name], radius=radius)
+                for name in names_to_add
+            ]
+            PoiMarker.add_many(view_widget,
+                               [marker for marker in added_markers if marker is not None])
 
         # If there is no active POI, set the combobox to nothing (-1)
-        active_poi = self._poi_manager_logic().active_poi
-        if active_poi in poi_names:
-            self._mw.active_poi_ComboBox.setCurrentText(active_poi)
-            self._markers[active_poi].select()
-            active_poi_pos = poi_dict[active_poi]
-            self._mw.poi_coords_label.setText(
-                '({0:.2r}m, {1:.2r}m, {2:.2r}m)'.format(ScaledFloat(active_poi_pos[0]),
-                                                        ScaledFloat(active_poi_pos[1]),
-                                                        ScaledFloat(active_poi_pos[2])))
-        else:
-            self._mw.active_poi_ComboBox.setCurrentIndex(-1)
+        active_poi = self._logic.active_poi
+        with QtCore.QSignalBlocker(self._mw.active_poi_ComboBox):
+            if active_poi in new_poi_names:
+                self._mw.active_poi_ComboBox.setCurrentText(active_poi)
+            else:
+                self._mw.active_poi_ComboBox.setCurrentIndex(-1)
+        if active_poi in new_poi_names:
+            self._select_poi_marker(active_poi)
+            self._update_poi_coords_label(active_poi, poi_dict[active_poi])
+        return
+
+    def _set_combobox_poi_names(self, poi_names):
+        """ Repopulate the active POI ComboBox with an already natural sorted list of names. """
+        self._sorted_poi_names = list(poi_names)
+        self._sorted_poi_keys = [natural_sort_key(name) for name in self._sorted_poi_names]
+        # Single model reset instead of one row insertion signal per item
+        self._mw.active_poi_ComboBox.model().setStringList(self._sorted_poi_names)
+        return
+
+    def _insert_combobox_poi_name(self, name):
+        """ Insert a single POI name into the active POI ComboBox at its natural sort position. """
+        key = natural_sort_key(name)
+        index = bisect.bisect_right(self._sorted_poi_keys, key)
+        self._sorted_poi_keys.insert(index, key)
+        self._sorted_poi_names.insert(index, name)
+        self._mw.active_poi_ComboBox.insertItem(index, name)
+        return
+
+    def _remove_combobox_poi_name(self, name):
+        """ Remove a single POI name from the active POI ComboBox. """
+        start = bisect.bisect_left(self._sorted_poi_keys, natural_sort_key(name))
+        try:
+            index = self._sorted_poi_names.index(name, start)
+        except ValueError:
+            return
+        del self._sorted_poi_keys[index]
+        del self._sorted_poi_names[index]
+        self._mw.active_poi_ComboBox.removeItem(index)
+        return
 
-        self._mw.active_poi_ComboBox.blockSignals(False)
+    def _select_poi_marker(self, name):
+        """
+        Highlight the marker of POI <name> and deselect the previously selected one.
+        Pass None to only deselect.
+        """
+        selected_marker = self._markers.get(self._selected_poi_name)
+        if selected_marker is not None:
+            selected_marker.deselect()
+        self._selected_poi_name = None
+        if name in self._markers:
+            self._markers[name].select()
+            self._selected_poi_name = name
         return
 
+    def _marker_radius(self):
+        """ POI marker radius derived from the optimizer XY size. Recomputed only on change. """
+        optimise_xy_size = self._logic.optimise_xy_size
+        if optimise_xy_size != self._cached_optimise_xy_size:
+            self._cached_optimise_xy_size = optimise_xy_size
+            self._cached_marker_radius = optimise_xy_size * _INV_SQRT2
+        return self._cached_marker_radius
+
     def _add_poi_marker(self, name, position):
         """ Add a circular POI marker to the ROI scan image. """
-        if name:
-            if name in self._markers:
-                self.log.error('Unable to add POI marker to ROI image. POI marker already present.')
-                return
-            marker = PoiMarker(position=position[:2],
-                               view_widget=self._mw.roi_image.plot_widget,
-                               poi_name=name,
-                               radius=self._poi_manager_logic().optimise_xy_size / np.sqrt(2),
-                               movable=False)
+        marker = self._create_poi_marker(name=name, position=position)
+        if marker is not None:
             # Add to the scan image widget
             marker.add_to_view_widget()
-            marker.sigPoiSelected.connect(
-                self._poi_manager_logic().set_active_poi, QtCore.Qt.QueuedConnection)
-            self._markers[name] = marker
         return
 
+    def _create_poi_marker(self, name, position, radius=None):
+        """
+        Create a circular POI marker and register it without adding it to the ROI scan image.
+
+        @param str name: POI name
+        @param float[] position: POI position. Only the first two (x, y) entries are used.
+        @param float radius: optional, marker radius. Derived from the logic if omitted.
+        @return PoiMarker: The created marker or None if no marker has been created
+        """
+        if not name:
+            return None
+        if name in self._markers:
+            self.log.error('Unable to add POI marker to ROI image. POI marker already present.')
+            return None
+        marker = PoiMarker(position=position[:2],
+                           view_widget=self._mw.roi_image.plot_widget,
+                           poi_name=name,
+                           radius=self._marker_radius() if radius is None else radius,
+                           registry=self._marker_registry,
+                           movable=False)
+        self._markers[name] = marker
+        return marker
+
     def _remove_poi_marker(self, name):
         """ Remove the POI marker for a POI that was deleted. """
-        if name in self._markers:
-            self._markers[name].delete_from_view_widget()
-            self._markers[name].sigPoiSelected.disconnect()
-            del self._markers[name]
+        marker = self._markers.pop(name, None)
+        if marker is not None:
+            marker.delete_from_view_widget()
+            if name == self._selected_poi_name:
+                self._selected_poi_name = None
         return
 
 
@@ -395,6 +395,7 @@ class PoiManagerLogic(LogicBase):
     sigPoiUpdated = QtCore.Signal(str, str, np.ndarray)  # old_name, new_name, current_position
     sigActivePoiUpdated = QtCore.Signal(str)
     sigRoiUpdated = QtCore.Signal(dict)  # Dict containing ROI parameters to update
+    sigPoiPositionsUpdated = QtCore.Signal(dict)  # POI positions after ROI shift, names unchanged
     sigThresholdUpdated = QtCore.Signal(float)
     sigDiameterUpdated = QtCore.Signal(float)
 
@@ -809,8 +810,8 @@ class PoiManagerLogic(LogicBase):
     def add_roi_position(self, position):
         with self._thread_lock:
             self._roi.add_history_entry(position)
-            self.sigRoiUpdated.emit({'pois': self.poi_positions,
-                                     'history': self.roi_pos_history,
+            self.sigPoiPositionsUpdated.emit(self.poi_positions)
+            self.sigRoiUpdated.emit({'history': self.roi_pos_history,
                                      'scan_image': self.roi_scan_image,
                                      'scan_image_extent': self.roi_scan_image_extent})
         return
@@ -827,8 +828,8 @@ class PoiManagerLogic(LogicBase):
             old_roi_origin = self.roi_origin
             self._roi.delete_history_entry(history_index)
             if np.any(old_roi_origin != self.roi_origin):
-                self.sigRoiUpdated.emit({'pois': self.poi_positions,
-                                         'history': self.roi_pos_history,
+                self.sigPoiPositionsUpdated.emit(self.poi_positions)
+                self.sigRoiUpdated.emit({'history': self.roi_pos_history,
                                          'scan_image': self.roi_scan_image,
                                          'scan_image_extent': self.roi_scan_image_extent})
             else:
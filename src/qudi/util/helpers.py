@@ -19,7 +19,8 @@ If not, see <https://www.gnu.org/licenses/>.
 
 __all__ = ['csv_2_list', 'in_range', 'is_complex', 'is_complex_type', 'is_float', 'is_float_type',
            'is_integer', 'is_integer_type', 'is_number', 'is_number_type', 'is_string',
-           'is_string_type', 'iter_modules_recursive', 'natural_sort', 'str_to_number']
+           'is_string_type', 'iter_modules_recursive', 'natural_sort', 'natural_sort_key',
+           'str_to_number']
 
 import re
 import os
@@ -28,6 +29,7 @@ import numpy as np
 from typing import Union, Optional, Iterable, List, Any, Type, Tuple, Callable
 
 _RealNumber = Union[int, float]
+_DIGITS_REGEX = re.compile(r'(\d+)')
 
 
 def iter_modules_recursive(paths: Union[str, Iterable[str]],
@@ -67,6 +69,18 @@ def iter_modules_recursive(paths: Union[str, Iterable[str]],
     return module_infos
 
 
+def natural_sort_key(key: str) -> Tuple[Union[str, int], ...]:
+    """
+    Sort key for a single str as used by natural_sort. Integer substrings compare by value.
+
+    @param str key: The str to compute the sort key for
+    @return tuple: alternating str and int chunks of key, always starting with a str chunk
+    """
+    # Splitting by a capturing group puts the matched digit runs at odd indices. Do not use
+    # str.isdigit here since it is also True for characters like "²" that int() rejects.
+    return tuple(int(s) if i % 2 else s for i, s in enumerate(_DIGITS_REGEX.split(key)))
+
+
 def natural_sort(iterable: Iterable[Any]) -> List[Any]:
     """
     Sort an iterable of str in an intuitive, natural way (human/natural sort).
@@ -75,10 +89,8 @@ def natural_sort(iterable: Iterable[Any]) -> List[Any]:
     @param str[] iterable: Iterable with str items to sort
     @return list: sorted list of strings
     """
-    def conv(s):
-        return int(s) if s.isdigit() else s
     try:
-        return sorted(iterable, key=lambda key: [conv(i) for i in re.split(r'(\d+)', key)])
+        return sorted(iterable, key=natural_sort_key)
     except:
         return sorted(iterable)
 
@@ -38,6 +38,8 @@ from qudi.util.paths import get_artwork_dir
 
 __ui_class_pattern = re.compile(r'class (Ui_.*?)\(')
 __artwork_path_pattern = re.compile(r'>(.*?/artwork/.*?)</')
+# Compiled Ui_... classes by absolute .ui-file path. Values are tuples (file mtime, class).
+__ui_class_cache = dict()
 
 
 def loadUi(file_path, base_widget):
@@ -49,9 +51,35 @@ def loadUi(file_path, base_widget):
     WARNING: base_widget must be of the same class as the top-level widget in the .ui file.
              Compatible subclasses of the top-level widget in the .ui file will also work.
 
+    The generated class is cached per .ui-file and only compiled again if the file has been
+    modified since, so repeatedly constructing the same widget does not spawn pyside2-uic again.
+
     @param str file_path: The full path to the .ui-file to load
     @param object base_widget: Instance of the base widget represented by the .ui-file
     """
+    file_path = os.path.abspath(file_path)
+    mtime = os.path.getmtime(file_path)
+    cached = __ui_class_cache.get(file_path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, _compile_ui_class(file_path))
+        __ui_class_cache[file_path] = cached
+
+    loader = cached[1]()
+    loader.setupUi(base_widget)
+    # Merge namespaces manually since this is not done by setupUi.
+    to_merge = vars(loader)
+    ignore = set(to_merge).intersection(set(base_widget.__dict__))  # Avoid namespace conflicts.
+    for key in ignore:
+        del to_merge[key]
+    base_widget.__dict__.update(to_merge)
+
+
+def _compile_ui_class(file_path):
+    """ Compiles a given .ui-file at <file_path> into python code and executes it.
+
+    @param str file_path: The full path to the .ui-file to compile
+    @return type: The generated Ui_... class
+    """
     # This step is a workaround because Qt Designer will only specify relative paths which is very
     # error prone if the user changes the cwd (e.g. os.chdir)
     converted = _convert_ui_to_absolute_paths(file_path)
@@ -91,16 +119,10 @@ def loadUi(file_path, base_widget):
     ui_module = module_from_spec(spec)
     exec(compiled, ui_module.__dict__)
 
-    loader = getattr(ui_module, class_name, None)()
-    if loader is None:
+    ui_class = getattr(ui_module, class_name, None)
+    if ui_class is None:
         raise RuntimeError('Unable to locate generated Ui_... class')
-    loader.setupUi(base_widget)
-    # Merge namespaces manually since this is not done by setupUi.
-    to_merge = vars(loader)
-    ignore = set(to_merge).intersection(set(base_widget.__dict__))  # Avoid namespace conflicts.
-    for key in ignore:
-        del to_merge[key]
-    base_widget.__dict__.update(to_merge)
+    return ui_class
 
 
 def _convert_ui_to_absolute_paths(file_path):
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+"""
+This file contains unit tests for the natural sorting helpers in qudi.util.helpers.
+
+Copyright (c) 2021, the qudi developers. See the AUTHORS.md file at the top-level directory of this
+distribution and on <https://github.com/Ulm-IQO/qudi-core/>
+
+This file is part of qudi.
+
+Qudi is free software: you can redistribute it and/or modify it under the terms of
+the GNU Lesser General Public License as published by the Free Software Foundation,
+either version 3 of the License, or (at your option) any later version.
+
+Qudi is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+See the GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License along with qudi.
+If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import bisect
+import unittest
+
+from qudi.util.helpers import natural_sort, natural_sort_key
+
+
+class TestNaturalSort(unittest.TestCase):
+
+    def test_natural_sort_key(self):
+        self.assertEqual(natural_sort_key('poi12b3'), ('poi', 12, 'b', 3, ''))
+        self.assertEqual(natural_sort_key('poi'), ('poi',))
+        self.assertEqual(natural_sort_key('12'), ('', 12, ''))
+        # Digit-like characters that int() rejects must be kept as text
+        self.assertEqual(natural_sort_key('NV1²'), ('NV', 1, '²'))
+        self.assertEqual(natural_sort_key('NV①'), ('NV①',))
+
+    def test_natural_sort(self):
+        names = ['poi10', 'poi2', 'NV1²', 'poi1', 'NV①', 'NV1', 'a']
+        self.assertEqual(natural_sort(names),
+                         ['NV1', 'NV1²', 'NV①', 'a', 'poi1', 'poi2', 'poi10'])
+
+    def test_natural_sort_key_bisect(self):
+        # Keys of mixed names must be comparable with each other (no str vs. int comparison)
+        names = natural_sort(['1a', 'a1', '²', 'poi2'])
+        keys = [natural_sort_key(name) for name in names]
+        index = bisect.bisect_left(keys, natural_sort_key('poi1'))
+        names.insert(index, 'poi1')
+        self.assertEqual(names, natural_sort(['1a', 'a1', '²', 'poi2', 'poi1']))
+        self.assertEqual(names, ['1a', 'a1', 'poi1', 'poi2', '²'])
+
+
+if __name__ == '__main__':
+    unittest.main()